@@ -2,69 +2,167 @@
 """
 Cache markdown descriptions for AI Engineer roles using r.jina.ai proxy.
 Allows resuming by skipping job IDs that already have cached files.
+Descriptions are stored gzip-compressed; detail_cache.py owns the on-disk layout.
 """
 
 from __future__ import annotations
 
+import gzip
 import json
+import os
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-DETAIL_DIR = Path("data/job_details")
-DETAIL_DIR.mkdir(parents=True, exist_ok=True)
+from detail_cache import COMPRESS_LEVEL, DETAIL_DIR, DETAIL_SUFFIX, compress_legacy_cache, detail_path
+
+try:
+    import orjson
+except ImportError:  # optional; load_jobs falls back to the stdlib json module
+    orjson = None
 
 JOB_LIST_PATH = Path("data/seek_ai_engineer_jobs.json")
 JOB_DETAIL_URL = "https://r.jina.ai/https://www.seek.com.au/job/{job_id}"
-DELAY_SECONDS = 0.6
+INITIAL_DELAY_SECONDS = 0.6
+MIN_DELAY_SECONDS = 0.1
+MAX_DELAY_SECONDS = 30.0
 TIMEOUT = 25
 MAX_ATTEMPTS = 4
-BACKOFF_SECONDS = 30
+# Number of job pages fetched in parallel; every worker waits on the shared THROTTLE.
+MAX_CONCURRENCY = 8
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# Shared keep-alive pool so workers reuse TLS connections to the proxy.
+# Retries stay disabled here; fetch_one handles them with its own back-off.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONCURRENCY, max_retries=Retry(total=0)),
+)
+_SESSION.headers["Accept-Encoding"] = "gzip, deflate"
+
+
+@dataclass
+class AdaptiveThrottle:
+    """AIMD-style spacing between requests: shrink gently while the proxy is healthy, double with jitter on rate limits.
+
+    Callers reserve slots on one shared schedule, so `delay` bounds the combined request rate of all workers.
+    """
+
+    delay: float = INITIAL_DELAY_SECONDS
+    min_delay: float = MIN_DELAY_SECONDS
+    max_delay: float = MAX_DELAY_SECONDS
+    _next_slot: float = field(default=0.0, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.delay
+        time.sleep(slot - now)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.delay = max(self.min_delay, self.delay * 0.9)
+
+    def on_rate_limit(self) -> None:
+        with self._lock:
+            self.delay = min(self.max_delay, self.delay * 2 + random.uniform(0, 0.5))
+            # Push the schedule back right away rather than after the slots already handed out.
+            self._next_slot = max(self._next_slot, time.monotonic() + self.delay)
+
+
+# Shared by all workers so one 429 slows every request to the proxy.
+THROTTLE = AdaptiveThrottle()
 
 
 def load_jobs() -> list[dict]:
     if not JOB_LIST_PATH.exists():
         raise SystemExit("AI job listing file not found. Run seek_job_analysis.py once first.")
-    return json.loads(JOB_LIST_PATH.read_text())
+    if orjson is not None:
+        return orjson.loads(JOB_LIST_PATH.read_bytes())
+    return json.loads(JOB_LIST_PATH.read_bytes())
+
+
+def stream_to_cache(resp: requests.Response, path: str) -> bool:
+    """Stream a response body into a gzip cache file; returns False and keeps nothing if it was blank."""
+    part_path = path + ".part"
+    has_content = False
+    try:
+        with gzip.open(part_path, "wb", compresslevel=COMPRESS_LEVEL) as handle:
+            for chunk in resp.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+                handle.write(chunk)
+                has_content = has_content or bool(chunk.strip())
+        if has_content:
+            os.replace(part_path, path)
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+    return has_content
+
+
+def fetch_one(idx: int, total: int, job_id: str) -> None:
+    path = detail_path(job_id)
+    attempt = 0
+    while attempt < MAX_ATTEMPTS:
+        attempt += 1
+        url = JOB_DETAIL_URL.format(job_id=job_id)
+        THROTTLE.wait()
+        cached = False
+        try:
+            with _SESSION.get(url, timeout=TIMEOUT, stream=True) as resp:
+                if resp.status_code == 200:
+                    cached = stream_to_cache(resp, path)
+                else:
+                    _ = resp.content  # drain the short error body so the connection returns to the pool
+        except requests.RequestException as exc:
+            print(f"[{idx}/{total}] {job_id}: attempt {attempt} failed ({exc})")
+            THROTTLE.on_rate_limit()
+            continue
+
+        if cached:
+            THROTTLE.on_success()
+            if idx % 20 == 0:
+                print(f"[{idx}/{total}] cached {job_id} (delay {THROTTLE.delay:.2f}s)")
+            return
+
+        if resp.status_code == 429:
+            THROTTLE.on_rate_limit()
+            print(f"[{idx}/{total}] {job_id}: 429 rate limited (attempt {attempt}), delay now {THROTTLE.delay:.2f}s")
+            continue
+
+        print(f"[{idx}/{total}] {job_id}: unexpected status {resp.status_code}")
+        return
+
+    print(f"[{idx}/{total}] {job_id}: giving up after {MAX_ATTEMPTS} attempts")
 
 
 def cache_details() -> None:
+    compress_legacy_cache()
     jobs = load_jobs()
-    remaining = sum(1 for job in jobs if not (DETAIL_DIR / f"{job['job_id']}.md").exists())
-    print(f"{remaining} job descriptions to fetch")
-
+    # One directory scan instead of a stat() per job; names are added as they're queued to skip duplicates.
+    cached = set(os.listdir(DETAIL_DIR))
+    pending = []
     for idx, job in enumerate(jobs, start=1):
-        job_id = job["job_id"]
-        path = DETAIL_DIR / f"{job_id}.md"
-        if path.exists():
-            continue
-
-        attempt = 0
-        while attempt < MAX_ATTEMPTS:
-            attempt += 1
-            url = JOB_DETAIL_URL.format(job_id=job_id)
-            try:
-                resp = requests.get(url, timeout=TIMEOUT)
-            except requests.RequestException as exc:
-                print(f"[{idx}/{len(jobs)}] {job_id}: attempt {attempt} failed ({exc})")
-                time.sleep(BACKOFF_SECONDS)
-                continue
-
-            if resp.status_code == 200 and resp.text.strip():
-                path.write_text(resp.text)
-                if idx % 20 == 0:
-                    print(f"[{idx}/{len(jobs)}] cached {job_id}")
-                time.sleep(DELAY_SECONDS)
-                break
-
-            if resp.status_code == 429:
-                print(f"[{idx}/{len(jobs)}] {job_id}: 429 rate limited (attempt {attempt}), backing off")
-                time.sleep(BACKOFF_SECONDS)
-                continue
-
-            print(f"[{idx}/{len(jobs)}] {job_id}: unexpected status {resp.status_code}")
-            break
+        name = job["job_id"] + DETAIL_SUFFIX
+        if name not in cached:
+            cached.add(name)
+            pending.append((idx, job["job_id"]))
+    print(f"{len(pending)} job descriptions to fetch")
+
+    # Requests are network-bound, so overlap them across a small worker pool.
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY) as pool:
+        futures = [pool.submit(fetch_one, idx, len(jobs), job_id) for idx, job_id in pending]
+        for future in futures:
+            future.result()
 
 
 if __name__ == "__main__":
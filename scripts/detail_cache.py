@@ -0,0 +1,45 @@
+"""
+Helpers for the gzip-compressed job description cache shared by cache_ai_job_details.py and
+seek_job_analysis.py.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+from pathlib import Path
+
+DETAIL_DIR = Path("data/job_details")
+DETAIL_DIR.mkdir(parents=True, exist_ok=True)
+DETAIL_PREFIX = os.path.join(DETAIL_DIR, "")
+DETAIL_SUFFIX = ".md.gz"
+
+COMPRESS_LEVEL = 6
+
+
+def detail_path(job_id: str) -> str:
+    """Cache file for a job, data/job_details/<job_id>.md.gz, as a plain string (no Path per job)."""
+    return DETAIL_PREFIX + job_id + DETAIL_SUFFIX
+
+
+def write_compressed(path: str, data: bytes) -> None:
+    """Gzip data into path via a .part file, so an interrupted write never leaves a truncated cache entry."""
+    part_path = path + ".part"
+    try:
+        with open(part_path, "wb") as handle:
+            handle.write(gzip.compress(data, compresslevel=COMPRESS_LEVEL))
+        os.replace(part_path, path)
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
+
+def compress_legacy_cache() -> None:
+    """Add a .md.gz copy of every plain .md description written before the cache was compressed.
+
+    The plain files are kept: the repository ships some of them as samples.
+    """
+    for plain_path in DETAIL_DIR.glob("*.md"):
+        compressed_path = detail_path(plain_path.stem)
+        if not os.path.exists(compressed_path):
+            write_compressed(compressed_path, plain_path.read_bytes())
@@ -8,17 +8,36 @@ Outputs JSON datasets for reuse and prints summary statistics for convenience.
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
+import os
 import time
-from collections import Counter, defaultdict
+import zlib
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from http.cookies import SimpleCookie
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+from urllib.parse import urlencode
 import re
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from detail_cache import compress_legacy_cache, detail_path, write_compressed
+
+try:
+    import hyperscan
+except ImportError:  # optional; extract_skills falls back to the combined regex
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:  # optional; parse_json / write_json fall back to the stdlib json module
+    orjson = None
 
 
 # ---------------------------------------------------------------------------
@@ -70,67 +89,78 @@ BASE_PARAMS = {
     "sortmode": "ListedDate",
 }
 
-# Conservative delay to avoid hammering the endpoint.
+# Conservative delay to avoid hammering the endpoint, applied between batches of pages.
 REQUEST_DELAY_SECONDS = 0.35
+PAGE_BATCH_SIZE = 4
+
+# Weekly buckets are computed on epoch seconds; 1970-01-05 was the first Monday after the epoch.
+MONDAY_EPOCH_SECONDS = 345_600
+SECONDS_PER_WEEK = 604_800
 
-# Skill lexicon tuned for AI / Python engineering roles. Each entry is matched case-insensitively.
+# Skill lexicon tuned for AI / Python engineering roles. Each entry is matched case-insensitively as a
+# whole word (the matchers add Unicode-aware word boundaries) against the raw markdown, so words inside
+# a skill are separated by \s+ (any run of whitespace, line breaks included) rather than a literal space.
 SKILL_PATTERNS = {
-    "python": r"\bpython\b",
-    "pytorch": r"\bpytorch\b",
-    "tensorflow": r"\btensorflow\b",
-    "keras": r"\bkeras\b",
-    "scikit-learn": r"\bscikit[- ]learn\b",
-    "pandas": r"\bpandas\b",
-    "numpy": r"\bnumpy\b",
-    "sql": r"\bsql\b",
-    "nosql": r"\bno[- ]?sql\b",
-    "spark": r"\bspark\b",
-    "databricks": r"\bdatabricks\b",
-    "aws": r"\baws\b",
-    "azure": r"\bazure\b",
-    "gcp": r"\bgoogle cloud\b|\bgcp\b",
-    "docker": r"\bdocker\b",
-    "kubernetes": r"\bkubernetes\b",
-    "mlops": r"\bml[- ]?ops\b",
-    "ci/cd": r"\bci/?cd\b",
-    "git": r"\bgit\b",
-    "linux": r"\blinux\b",
-    "rest api": r"\brest(ful)?\s+api\b",
-    "grpc": r"\bgrpc\b",
-    "microservices": r"\bmicro-?services\b",
-    "nlp": r"\bnatural language processing\b|\bnlp\b",
-    "computer vision": r"\bcomputer vision\b",
-    "reinforcement learning": r"\breinforcement learning\b",
-    "machine learning": r"\bmachine learning\b",
-    "deep learning": r"\bdeep learning\b",
-    "generative ai": r"\bgenerative ai\b",
-    "llm": r"\bllms?\b|\blarge language model\b",
-    "rag": r"\brag\b|\bretrieval[- ]augmented\b",
-    "prompt engineering": r"\bprompt engineering\b",
-    "statistics": r"\bstatistics?\b",
-    "probability": r"\bprobabilit(y|ies)\b",
-    "linear algebra": r"\blinear algebra\b",
-    "agile": r"\bagile\b",
-    "jira": r"\bjira\b",
-    "power bi": r"\bpower bi\b",
-    "tableau": r"\btableau\b",
-    "snowflake": r"\bsnowflake\b",
-    "bigquery": r"\bbigquery\b",
-    "airflow": r"\bairflow\b",
-    "sql server": r"\bsql server\b",
-    "postgresql": r"\bpostgres(ql)?\b",
-    "mongodb": r"\bmongodb\b",
+    "python": r"python",
+    "pytorch": r"pytorch",
+    "tensorflow": r"tensorflow",
+    "keras": r"keras",
+    "scikit-learn": r"scikit(?:-|\s+)learn",
+    "pandas": r"pandas",
+    "numpy": r"numpy",
+    "sql": r"sql",
+    "nosql": r"no(?:-|\s+)?sql",
+    "spark": r"spark",
+    "databricks": r"databricks",
+    "aws": r"aws",
+    "azure": r"azure",
+    "gcp": r"google\s+cloud|gcp",
+    "docker": r"docker",
+    "kubernetes": r"kubernetes",
+    "mlops": r"ml(?:-|\s+)?ops",
+    "ci/cd": r"ci/?cd",
+    "git": r"git",
+    "linux": r"linux",
+    "rest api": r"rest(ful)?\s+api",
+    "grpc": r"grpc",
+    "microservices": r"micro-?services",
+    "nlp": r"natural\s+language\s+processing|nlp",
+    "computer vision": r"computer\s+vision",
+    "reinforcement learning": r"reinforcement\s+learning",
+    "machine learning": r"machine\s+learning",
+    "deep learning": r"deep\s+learning",
+    "generative ai": r"generative\s+ai",
+    "llm": r"llms?|large\s+language\s+model",
+    "rag": r"rag|retrieval(?:-|\s+)augmented",
+    "prompt engineering": r"prompt\s+engineering",
+    "statistics": r"statistics?",
+    "probability": r"probabilit(y|ies)",
+    "linear algebra": r"linear\s+algebra",
+    "agile": r"agile",
+    "jira": r"jira",
+    "power bi": r"power\s+bi",
+    "tableau": r"tableau",
+    "snowflake": r"snowflake",
+    "bigquery": r"bigquery",
+    "airflow": r"airflow",
+    "sql server": r"sql\s+server",
+    "postgresql": r"postgres(ql)?",
+    "mongodb": r"mongodb",
 }
 
 COLLECT_SKILLS = False
-DETAIL_CACHE_DIR = Path("data/job_details")
-DETAIL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+DETAIL_POOL_SIZE = 8
+DETAIL_READ_WORKERS = 8
+SKILLS_CACHE_PATH = Path("data/seek_skills_cache.json")
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class JobRecord:
     job_id: str
     title: str
@@ -146,9 +176,27 @@ class JobRecord:
 # ---------------------------------------------------------------------------
 
 def parse_cookies(cookie_blob: str) -> Dict[str, str]:
-    jar = SimpleCookie()
-    jar.load(cookie_blob)
-    return {key: morsel.value for key, morsel in jar.items()}
+    """Split a browser ``Cookie`` header into name/value pairs, keeping values verbatim."""
+    pairs = (part.strip() for part in cookie_blob.split(";"))
+    return dict(pair.split("=", 1) for pair in pairs if "=" in pair)
+
+
+def parse_json(raw: bytes) -> object:
+    """Parse UTF-8 JSON bytes without decoding them to str first when orjson is available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json(path: Path, payload: object) -> None:
+    """Write indented JSON, serialised straight to UTF-8 bytes by orjson when available."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(payload, indent=2))
+
+
+COOKIES = parse_cookies(COOKIE_BLOB)
 
 
 def iso_to_datetime(value: str) -> datetime:
@@ -156,31 +204,198 @@ def iso_to_datetime(value: str) -> datetime:
     return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 
-def week_floor(date_obj: datetime) -> datetime:
-    """Return the Monday (00:00 UTC) for the week of the provided datetime."""
-    monday = date_obj - timedelta(days=date_obj.weekday())
-    return datetime(monday.year, monday.month, monday.day, tzinfo=timezone.utc)
+def week_floor(timestamp: int) -> int:
+    """Return the epoch seconds of the Monday (00:00 UTC) starting the week of the given timestamp."""
+    return timestamp - (timestamp - MONDAY_EPOCH_SECONDS) % SECONDS_PER_WEEK
 
 
-def normalise_markdown(markdown: str) -> str:
-    """Lower-case and strip control characters from markdown content."""
-    return " ".join(markdown.lower().split())
+def extract_skills(markdown_text: str) -> Set[str]:
+    if SKILL_DATABASE is not None:
+        return scan_skill_database(markdown_text.encode())
+    return match_skill_patterns(markdown_text)
 
 
-def extract_skills(markdown_text: str) -> Set[str]:
-    text = normalise_markdown(markdown_text)
+def extract_skills_from_bytes(data: bytes) -> Set[str]:
+    """Match skills against UTF-8 markdown, e.g. a decompressed cache file."""
+    if SKILL_DATABASE is not None:
+        return scan_skill_database(data)
+    return match_skill_patterns(data.decode("utf-8", "replace"))
+
+
+def scan_skill_database(data: bytes) -> Set[str]:
+    # Hyperscan's UTF-8 mode is undefined on malformed input, so repair it first.
+    if not data.isascii():
+        try:
+            data.decode("utf-8")
+        except UnicodeDecodeError:
+            data = data.decode("utf-8", "replace").encode()
+
     hits: Set[str] = set()
-    for label, pattern in SKILL_REGEX.items():
-        if pattern.search(text):
-            hits.add(label)
+
+    def on_match(skill_id: int, start: int, end: int, flags: int, context: object) -> None:
+        hits.add(SKILL_LABELS[skill_id])
+
+    SKILL_DATABASE.scan(data, match_event_handler=on_match)
     return hits
 
 
+def match_skill_patterns(text: str) -> Set[str]:
+    """Regex fallback used when Hyperscan isn't installed."""
+    # Plain-word skills are located with str.find; only the rest go through the regex engine.
+    lowered = text.lower()
+    hits = {label for label, word in SKILL_LITERALS.items() if contains_word(lowered, word)}
+    for match in SKILL_COMBINED.finditer(text):
+        first = int(match.lastgroup[1:])
+        hits.add(RESIDUAL_LABELS[first])
+        # Later alternatives matching at the same offset (e.g. "sql server" behind "sql") are shadowed.
+        for label in RESIDUAL_LABELS[first + 1:]:
+            if label not in hits and SKILL_REGEX[label].match(text, match.start()):
+                hits.add(label)
+    return hits
+
+
+def is_word_char(char: str) -> bool:
+    """Same notion of a word character as the re module's Unicode \\w."""
+    return char.isalnum() or char == "_"
+
+
+def contains_word(text: str, word: str) -> bool:
+    """Equivalent of re.search(r"\\b" + word + r"\\b", text) for an alphanumeric word."""
+    start = text.find(word)
+    while start != -1:
+        end = start + len(word)
+        if (start == 0 or not is_word_char(text[start - 1])) and (end == len(text) or not is_word_char(text[end])):
+            return True
+        start = text.find(word, start + 1)
+    return False
+
+
+def word_pattern(pattern: str) -> str:
+    return rf"(?<!\w)(?:{pattern})(?!\w)"
+
+
 def build_skill_regex() -> Dict[str, "re.Pattern[str]"]:
-    return {label: re.compile(pattern, flags=re.IGNORECASE) for label, pattern in SKILL_PATTERNS.items()}
+    return {
+        label: re.compile(word_pattern(pattern), flags=re.IGNORECASE) for label, pattern in SKILL_PATTERNS.items()
+    }
+
+
+def split_literal_skills() -> Dict[str, str]:
+    """Skills whose pattern is just an alphanumeric literal, e.g. r"docker"."""
+    return {label: pattern for label, pattern in SKILL_PATTERNS.items() if LITERAL_SKILL_RE.fullmatch(pattern)}
+
+
+def build_combined_skill_regex(labels: List[str]) -> "re.Pattern[str]":
+    """Single alternation over the given skills so each description is scanned once.
+
+    Every skill starts on a word boundary, so the scan only tries the alternation at word starts;
+    the lookahead keeps matches zero-width so overlapping skills are still seen.
+    """
+    alternatives = "|".join(f"(?P<g{idx}>(?:{SKILL_PATTERNS[label]})(?!\\w))" for idx, label in enumerate(labels))
+    return re.compile(rf"\b(?=\w)(?=(?:{alternatives}))", flags=re.IGNORECASE)
+
+
+def read_cached_detail(job_id: str, skills_cache: Dict[str, list]) -> Optional[Tuple[List[int], Optional[bytes]]]:
+    """Fingerprint a cached description and load it only if its skills cache entry is stale.
+
+    Returns None when the job has no usable cached description. Only reads and decompresses, so it is
+    safe to run on reader threads.
+    """
+    path = detail_path(job_id)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    fingerprint = [stat.st_mtime_ns, stat.st_size]
+    entry = skills_cache.get(job_id)
+    if entry is not None and entry[:2] == fingerprint:
+        return fingerprint, None
+    with open(path, "rb") as handle:
+        compressed = handle.read()
+    try:
+        return fingerprint, gzip.decompress(compressed)
+    except (EOFError, gzip.BadGzipFile, zlib.error):
+        # Damaged entry (e.g. left by an interrupted older run): treat as uncached so it is fetched again.
+        return None
 
 
+def read_ahead(
+    pool: ThreadPoolExecutor,
+    func: Callable[[T], R],
+    items: Iterable[T],
+    window: int,
+) -> Iterator[Tuple[T, R]]:
+    """Like pool.map, but keeps at most `window` calls in flight so results can't pile up ahead of the consumer."""
+    remaining = iter(items)
+    pending = deque((item, pool.submit(func, item)) for item in islice(remaining, window))
+    while pending:
+        item, future = pending.popleft()
+        for upcoming in islice(remaining, 1):
+            pending.append((upcoming, pool.submit(func, upcoming)))
+        yield item, future.result()
+
+
+def cached_skills(
+    job_id: str,
+    fingerprint: List[int],
+    data: Optional[bytes],
+    skills_cache: Dict[str, list],
+) -> Set[str]:
+    """Skills for a cached description, scanning only when read_cached_detail had to load it."""
+    if data is None:
+        return set(skills_cache[job_id][2])
+    skills = extract_skills_from_bytes(data)
+    skills_cache[job_id] = fingerprint + [sorted(skills)]
+    return skills
+
+
+def load_skills_cache() -> Dict[str, list]:
+    """Load per-job skill results, discarding them if SKILL_PATTERNS changed since they were written."""
+    if not SKILLS_CACHE_PATH.exists():
+        return {}
+    payload = parse_json(SKILLS_CACHE_PATH.read_bytes())
+    if payload.get("lexicon") != SKILL_LEXICON_KEY:
+        return {}
+    return payload.get("jobs", {})
+
+
+def save_skills_cache(skills_cache: Dict[str, list]) -> None:
+    tmp_path = SKILLS_CACHE_PATH.with_suffix(".json.tmp")
+    write_json(tmp_path, {"lexicon": SKILL_LEXICON_KEY, "jobs": skills_cache})
+    os.replace(tmp_path, SKILLS_CACHE_PATH)
+
+
+def build_skill_database() -> Optional["hyperscan.Database"]:
+    """Compile all skills into one Hyperscan database when the binding is installed."""
+    if hyperscan is None:
+        return None
+    # Hyperscan has no Unicode \b, so boundaries are spelled out as (consumed) non-word neighbours.
+    expressions = [
+        f"(?:^|{HS_NON_WORD})(?:{pattern})(?:{HS_NON_WORD}|$)".replace(r"\s", HS_WHITESPACE).encode()
+        for pattern in SKILL_PATTERNS.values()
+    ]
+    database = hyperscan.Database()
+    database.compile(
+        expressions=expressions,
+        ids=list(range(len(SKILL_PATTERNS))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8]
+        * len(SKILL_PATTERNS),
+    )
+    return database
+
+
+LITERAL_SKILL_RE = re.compile(r"[a-z0-9]+")
+# Unicode \w / \s equivalents for Hyperscan (str.isspace also counts \x1c-\x1f and \x85).
+HS_NON_WORD = r"[^\p{L}\p{N}_]"
+HS_WHITESPACE = r"[\s\p{Z}\x{1c}-\x{1f}\x{85}]"
+
+SKILL_LABELS = list(SKILL_PATTERNS)
 SKILL_REGEX = build_skill_regex()
+SKILL_LITERALS = split_literal_skills()
+RESIDUAL_LABELS = [label for label in SKILL_LABELS if label not in SKILL_LITERALS]
+SKILL_COMBINED = build_combined_skill_regex(RESIDUAL_LABELS)
+SKILL_DATABASE = build_skill_database()
+SKILL_LEXICON_KEY = hashlib.sha1(json.dumps(SKILL_PATTERNS, sort_keys=True).encode()).hexdigest()
 
 
 # ---------------------------------------------------------------------------
@@ -188,10 +403,31 @@ SKILL_REGEX = build_skill_regex()
 # ---------------------------------------------------------------------------
 
 def build_session() -> Tuple[requests.Session, Dict[str, str]]:
-    cookies = parse_cookies(COOKIE_BLOB)
     session = requests.Session()
     session.headers.update(BASE_HEADERS)
-    return session, cookies
+    return session, COOKIES
+
+
+def build_detail_session() -> requests.Session:
+    """Session for the r.jina.ai proxy; kept apart from the Seek session so its headers don't leak."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=DETAIL_POOL_SIZE))
+    return session
+
+
+DETAIL_SESSION = build_detail_session()
+
+
+def fetch_search_page(
+    session: requests.Session,
+    cookies: Dict[str, str],
+    search_query: str,
+    page: int,
+) -> List[dict]:
+    response = session.get(f"{SEARCH_URL}?{search_query}&page={page}", cookies=cookies, timeout=30)
+    response.raise_for_status()
+    payload = parse_json(response.content)
+    return payload.get("data", [])
 
 
 def fetch_jobs_for_keyword(
@@ -206,47 +442,54 @@ def fetch_jobs_for_keyword(
     seen_ids: Set[str] = set()
     page = 1
     reached_cutoff = False
-
-    while page <= max_pages and not reached_cutoff:
-        params = BASE_PARAMS.copy()
-        params.update({"keywords": keyword, "page": page})
-        response = session.get(SEARCH_URL, params=params, cookies=cookies, timeout=30)
-        response.raise_for_status()
-        payload = response.json()
-        jobs = payload.get("data", [])
-
-        if not jobs:
-            break
-
-        for job in jobs:
-            job_id = job.get("id")
-            if not job_id or job_id in seen_ids:
-                continue
-
-            listing_date_raw = job.get("listingDate")
-            if not listing_date_raw:
-                continue
-
-            listing_dt = iso_to_datetime(listing_date_raw)
-            if listing_dt < cutoff:
-                reached_cutoff = True
-                continue
-
-            seen_ids.add(job_id)
-            location = ", ".join(loc.get("label") for loc in job.get("locations", []) if loc.get("label")) or None
-            work_type = ", ".join(job.get("workTypes") or []) or None
-            record = JobRecord(
-                job_id=job_id,
-                title=job.get("title") or "",
-                listing_date=listing_dt,
-                location=location,
-                employer=(job.get("companyName") or job.get("advertiser", {}).get("description")),
-                work_type=work_type,
-            )
-            results.append(record)
-
-        page += 1
-        time.sleep(REQUEST_DELAY_SECONDS)
+    exhausted = False
+    # Everything but the page number is fixed per keyword, so encode it once.
+    search_query = urlencode({**BASE_PARAMS, "keywords": keyword})
+
+    # Pages are independent, so request a small window of them at once and walk the results in order.
+    with ThreadPoolExecutor(max_workers=PAGE_BATCH_SIZE) as pool:
+        while page <= max_pages and not (reached_cutoff or exhausted):
+            batch = range(page, min(page + PAGE_BATCH_SIZE, max_pages + 1))
+            pages = pool.map(lambda number: fetch_search_page(session, cookies, search_query, number), batch)
+
+            for jobs in pages:
+                if not jobs:
+                    exhausted = True
+                    break
+
+                for job in jobs:
+                    job_id = job.get("id")
+                    if not job_id or job_id in seen_ids:
+                        continue
+
+                    listing_date_raw = job.get("listingDate")
+                    if not listing_date_raw:
+                        continue
+
+                    listing_dt = iso_to_datetime(listing_date_raw)
+                    if listing_dt < cutoff:
+                        reached_cutoff = True
+                        continue
+
+                    seen_ids.add(job_id)
+                    labels = (loc.get("label") for loc in job.get("locations", []))
+                    location = ", ".join(label for label in labels if label) or None
+                    work_type = ", ".join(job.get("workTypes") or []) or None
+                    record = JobRecord(
+                        job_id=job_id,
+                        title=job.get("title") or "",
+                        listing_date=listing_dt,
+                        location=location,
+                        employer=(job.get("companyName") or job.get("advertiser", {}).get("description")),
+                        work_type=work_type,
+                    )
+                    results.append(record)
+
+                if reached_cutoff:
+                    break
+
+            page += len(batch)
+            time.sleep(REQUEST_DELAY_SECONDS)
 
     return results
 
@@ -254,7 +497,7 @@ def fetch_jobs_for_keyword(
 def fetch_job_markdown(job_id: str, timeout: int = 30) -> Optional[str]:
     url = JOB_DETAIL_PROXY.format(job_id=job_id)
     try:
-        resp = requests.get(url, timeout=timeout)
+        resp = DETAIL_SESSION.get(url, timeout=timeout)
         if resp.status_code == 200 and resp.text.strip():
             return resp.text
         return None
@@ -267,20 +510,23 @@ def fetch_job_markdown(job_id: str, timeout: int = 30) -> Optional[str]:
 # ---------------------------------------------------------------------------
 
 def summarise_weekly_counts(records: Iterable[JobRecord]) -> Dict[str, int]:
-    buckets: Counter[str] = Counter()
-    for record in records:
-        week_key = week_floor(record.listing_date).date().isoformat()
-        buckets[week_key] += 1
-    return dict(sorted(buckets.items()))
+    buckets = Counter(week_floor(int(record.listing_date.timestamp())) for record in records)
+    # Format each distinct week once rather than once per record.
+    return {
+        datetime.fromtimestamp(week, tz=timezone.utc).date().isoformat(): count
+        for week, count in sorted(buckets.items())
+    }
 
 
 def compute_skill_frequencies(records: Iterable[JobRecord]) -> Dict[str, int]:
-    counts: Counter[str] = Counter()
-    for record in records:
-        if not record.description_text:
-            continue
-        for skill in extract_skills(record.description_text):
-            counts[skill] += 1
+    counts = Counter(
+        chain.from_iterable(extract_skills(record.description_text) for record in records if record.description_text)
+    )
+    return rank_skill_counts(counts)
+
+
+def rank_skill_counts(counts: Counter[str]) -> Dict[str, int]:
+    """Order skills by descending frequency, then alphabetically."""
     return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
 
 
@@ -298,21 +544,19 @@ def collect_and_analyse(keywords: List[str]) -> Dict[str, dict]:
         print(f"  collected {len(job_records)} recent postings")
 
         dataset_path = Path("data") / f"seek_{keyword.replace(' ', '_')}_jobs.json"
-        dataset_path.write_text(
-            json.dumps(
-                [
-                    {
-                        "job_id": rec.job_id,
-                        "title": rec.title,
-                        "listing_date": rec.listing_date.isoformat(),
-                        "location": rec.location,
-                        "employer": rec.employer,
-                        "work_type": rec.work_type,
-                    }
-                    for rec in job_records
-                ],
-                indent=2,
-            )
+        write_json(
+            dataset_path,
+            [
+                {
+                    "job_id": rec.job_id,
+                    "title": rec.title,
+                    "listing_date": rec.listing_date.isoformat(),
+                    "location": rec.location,
+                    "employer": rec.employer,
+                    "work_type": rec.work_type,
+                }
+                for rec in job_records
+            ],
         )
 
         weekly = summarise_weekly_counts(job_records)
@@ -327,28 +571,38 @@ def collect_and_analyse(keywords: List[str]) -> Dict[str, dict]:
         if COLLECT_SKILLS and "ai" in keyword.lower() and job_records:
             print("  loading job descriptions for skill analysis (AI roles)...")
             skills_counts: Counter[str] = Counter()
-            for rec in job_records:
-                detail_path = DETAIL_CACHE_DIR / f"{rec.job_id}.md"
-                if detail_path.exists():
-                    rec.description_text = detail_path.read_text()
-                else:
+            skills_cache = load_skills_cache()
+            compress_legacy_cache()
+            # Cached files are read ahead on a small pool; skill matching and network fetches stay on this thread.
+            with ThreadPoolExecutor(max_workers=DETAIL_READ_WORKERS) as pool:
+                details = read_ahead(
+                    pool,
+                    lambda rec: read_cached_detail(rec.job_id, skills_cache),
+                    job_records,
+                    window=2 * DETAIL_READ_WORKERS,
+                )
+                for rec, detail in details:
+                    if detail is not None:
+                        fingerprint, data = detail
+                        skills_counts.update(cached_skills(rec.job_id, fingerprint, data, skills_cache))
+                        continue
                     markdown = fetch_job_markdown(rec.job_id)
                     if markdown:
                         rec.description_text = markdown
-                        detail_path.write_text(markdown)
+                        write_compressed(detail_path(rec.job_id), markdown.encode())
                     time.sleep(0.2)
-                if rec.description_text:
-                    for skill in extract_skills(rec.description_text):
-                        skills_counts[skill] += 1
+                    if rec.description_text:
+                        skills_counts.update(extract_skills(rec.description_text))
 
-            skills = dict(sorted(skills_counts.items(), key=lambda item: (-item[1], item[0])))
-            (Path("data") / "seek_ai_skills.json").write_text(json.dumps(skills, indent=2))
+            save_skills_cache(skills_cache)
+            skills = rank_skill_counts(skills_counts)
+            write_json(Path("data") / "seek_ai_skills.json", skills)
             analysis_entry["skill_frequencies"] = skills
 
         summary[keyword] = analysis_entry
 
     summary_path = Path("data") / "seek_job_summary.json"
-    summary_path.write_text(json.dumps(summary, indent=2))
+    write_json(summary_path, summary)
     return summary
 
 
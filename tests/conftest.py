@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The scripts aren't a package; make them importable the same way running them directly does.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
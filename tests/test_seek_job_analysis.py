@@ -0,0 +1,139 @@
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+import seek_job_analysis as analysis
+from detail_cache import write_compressed
+
+SAMPLE_DIR = Path(__file__).resolve().parents[1] / "data" / "job_details"
+
+EDGE_TEXTS = [
+    "We use SQL Server and sql, no-sql, Probabilities, RESTful  API, CI/CD, large\nlanguage model",
+    "scikit\n\nlearn, ml \n ops, no  sql, machine learning",
+    "épython pythoné ’python PYTHON_ python2 ٣python",
+    "_sql sql_ x-sql-y postgres LLMs google\tcloud",
+]
+
+
+def epoch(*args: int) -> int:
+    return int(datetime(*args, tzinfo=timezone.utc).timestamp())
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("python", True),
+        ("python is great", True),
+        ("i like python", True),
+        ("(python)", True),
+        ("pythonic", False),
+        ("cpython", False),
+        ("python_", False),
+        ("_python", False),
+        ("python3", False),
+        ("3python", False),
+        ("épython", False),
+        ("pythoné", False),
+        ("pythonpython python", True),
+        ("", False),
+    ],
+)
+def test_contains_word_boundaries(text, expected):
+    assert analysis.contains_word(text, "python") is expected
+
+
+def test_split_literal_skills_only_takes_plain_words():
+    assert analysis.SKILL_LITERALS["python"] == "python"
+    assert "sql server" not in analysis.SKILL_LITERALS
+    assert "ci/cd" not in analysis.SKILL_LITERALS
+    assert set(analysis.SKILL_LITERALS) | set(analysis.RESIDUAL_LABELS) == set(analysis.SKILL_PATTERNS)
+
+
+def test_fallback_reports_skills_shadowed_at_same_offset():
+    assert {"sql", "sql server"} <= analysis.match_skill_patterns("Experience with SQL Server")
+
+
+def test_fallback_accepts_whitespace_runs():
+    hits = analysis.match_skill_patterns("scikit\n\nlearn, ml \n ops, no  sql")
+    assert {"scikit-learn", "mlops", "nosql"} <= hits
+
+
+def test_extract_skills_from_bytes_matches_str_entry_point():
+    text = EDGE_TEXTS[0]
+    assert analysis.extract_skills_from_bytes(text.encode()) == analysis.extract_skills(text)
+
+
+@pytest.mark.parametrize("text", EDGE_TEXTS + [path.read_text() for path in sorted(SAMPLE_DIR.glob("*.md"))])
+def test_hyperscan_matches_regex_fallback(text):
+    pytest.importorskip("hyperscan")
+    assert analysis.scan_skill_database(text.encode()) == analysis.match_skill_patterns(text)
+
+
+@pytest.mark.parametrize(
+    "timestamp, monday",
+    [
+        (epoch(2025, 10, 20), epoch(2025, 10, 20)),
+        (epoch(2025, 10, 20, 13, 5), epoch(2025, 10, 20)),
+        (epoch(2025, 10, 26, 23, 59, 59), epoch(2025, 10, 20)),
+        (epoch(2025, 10, 27), epoch(2025, 10, 27)),
+        (epoch(1970, 1, 5), epoch(1970, 1, 5)),
+        (epoch(1970, 1, 4), epoch(1969, 12, 29)),
+    ],
+)
+def test_week_floor(timestamp, monday):
+    assert analysis.week_floor(timestamp) == monday
+
+
+def test_summarise_weekly_counts():
+    records = [
+        analysis.JobRecord("1", "", datetime(2025, 10, 21, tzinfo=timezone.utc), None, None, None),
+        analysis.JobRecord("2", "", datetime(2025, 10, 26, 23, tzinfo=timezone.utc), None, None, None),
+        analysis.JobRecord("3", "", datetime(2025, 10, 13, tzinfo=timezone.utc), None, None, None),
+    ]
+    assert analysis.summarise_weekly_counts(records) == {"2025-10-13": 1, "2025-10-20": 2}
+
+
+@pytest.fixture
+def skills_cache_env(tmp_path, monkeypatch):
+    monkeypatch.setattr(analysis, "SKILLS_CACHE_PATH", tmp_path / "skills_cache.json")
+    monkeypatch.setattr(analysis, "detail_path", lambda job_id: str(tmp_path / f"{job_id}.md.gz"))
+    return tmp_path
+
+
+def test_skills_cache_round_trip(skills_cache_env):
+    analysis.save_skills_cache({"1": [1, 2, ["python"]]})
+    assert analysis.load_skills_cache() == {"1": [1, 2, ["python"]]}
+
+
+def test_skills_cache_discarded_when_lexicon_changes(skills_cache_env, monkeypatch):
+    analysis.save_skills_cache({"1": [1, 2, ["python"]]})
+    monkeypatch.setattr(analysis, "SKILL_LEXICON_KEY", "different")
+    assert analysis.load_skills_cache() == {}
+
+
+def test_cached_detail_rescanned_only_when_file_changes(skills_cache_env):
+    write_compressed(analysis.detail_path("1"), b"python and docker")
+    skills_cache = {}
+
+    fingerprint, data = analysis.read_cached_detail("1", skills_cache)
+    assert data == b"python and docker"
+    assert analysis.cached_skills("1", fingerprint, data, skills_cache) == {"python", "docker"}
+
+    fingerprint, data = analysis.read_cached_detail("1", skills_cache)
+    assert data is None
+    assert analysis.cached_skills("1", fingerprint, data, skills_cache) == {"python", "docker"}
+
+    write_compressed(analysis.detail_path("1"), b"python, docker and kubernetes")
+    fingerprint, data = analysis.read_cached_detail("1", skills_cache)
+    assert data is not None
+    assert analysis.cached_skills("1", fingerprint, data, skills_cache) == {"python", "docker", "kubernetes"}
+
+
+def test_read_cached_detail_missing_or_corrupt(skills_cache_env):
+    assert analysis.read_cached_detail("missing", {}) is None
+    path = analysis.detail_path("2")
+    write_compressed(path, b"python " * 1000)
+    blob = Path(path).read_bytes()
+    Path(path).write_bytes(blob[: len(blob) // 2])
+    assert analysis.read_cached_detail("2", {}) is None